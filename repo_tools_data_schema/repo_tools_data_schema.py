@@ -2,7 +2,6 @@
 Functions for validating the schema of repo-tools-data.
 """
 
-import collections
 import csv
 import difflib
 import re
@@ -11,14 +10,21 @@ import yaml
 from schema import Optional, Or, Schema
 from yaml.constructor import ConstructorError
 
+# Use the libyaml-backed loader when it's available: it's much faster.
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Validators run once per value, so compile their regexes just once.
+# Emails can't contain spaces or any of ,;?\% anywhere.
+_EMAIL_RE = re.compile(r"^[^@ ,;?\\%]+@[^@ ,;?\\%]+\.[^@ ,;?\\%]+$")
+_USERNAME_RE = re.compile(r"^[a-zA-Z0-9_-]+\*?$")
+
+# Usernames can have "[bot]" at the end for bots.
+_BOT_SUFFIXES = ("[bot]", "%5Bbot%5D")
+
 
 def valid_email(s):
     """Is this a valid email?"""
-    return bool(
-        isinstance(s, str) and
-        re.search(r"^[^@ ]+@[^@ ]+\.[^@ ]+$", s) and
-        not re.search(r"[,;?\\%]", s)
-    )
+    return isinstance(s, str) and _EMAIL_RE.match(s) is not None
 
 
 def not_empty_string(s):
@@ -28,15 +34,14 @@ def not_empty_string(s):
 
 def github_username(s):
     """Is this a valid GitHub username?"""
-    # Usernames can have "[bot]" at the end for bots.
-    suffixes = ["[bot]", "%5Bbot%5D"]
-    for suffix in suffixes:
-        if s.endswith(suffix):
-            s = s[:-len(suffix)]
-            break
+    if s.endswith(_BOT_SUFFIXES):
+        for suffix in _BOT_SUFFIXES:
+            if s.endswith(suffix):
+                s = s[:-len(suffix)]
+                break
     # For Anant, we added a star just to be sure we wouldn't find some other
     # account, so allow a star at the end.
-    return re.match(r"^[a-zA-Z0-9_-]+\*?$", s)
+    return _USERNAME_RE.match(s) is not None
 
 
 ORGS_SCHEMA = Schema(
@@ -64,9 +69,9 @@ ORGS_SCHEMA = Schema(
 # from https://bitbucket.org/xi/pyyaml/issues/9/ignore-duplicate-keys-and-send-warning-or
 
 def mapping_constructor(loader, node, deep=False):
-    """Prevent duplicate keys and return an OrderedDict."""
+    """Prevent duplicate keys and return a dict."""
 
-    mapping = collections.OrderedDict()
+    mapping = {}
     for key_node, value_node in node.value:
         key = loader.construct_object(key_node, deep=deep)
         value = loader.construct_object(value_node, deep=deep)
@@ -79,6 +84,7 @@ def mapping_constructor(loader, node, deep=False):
 
 
 yaml.SafeLoader.add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, mapping_constructor)
+Loader.add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, mapping_constructor)
 
 
 # The public functions.
@@ -88,7 +94,7 @@ def validate_orgs(filename):
     Validate that `filename` conforms to our orgs.yaml schema.
     """
     with open(filename) as f:
-        orgs = yaml.safe_load(f)
+        orgs = yaml.load(f, Loader=Loader)
     ORGS_SCHEMA.validate(orgs)
     # keys should be sorted.
     assert_sorted(orgs, "Keys in {}".format(filename))
@@ -99,17 +105,23 @@ def validate_salesforce_export(filename, encoding="cp1252"):
     Validate that `filename` is a Salesforce export we expect.
     """
     with open(filename, encoding=encoding) as fcsv:
-        reader = csv.DictReader(fcsv)
-        assert reader.fieldnames == [
+        reader = csv.reader(fcsv)
+        fieldnames = next(reader, None)
+        assert fieldnames == [
             "First Name", "Last Name", "Number of Active Ind. CLA Contracts",
             "Title", "Account Name", "Number of Active Entity CLA Contracts", "GitHub Username",
         ]
+        acct_col = fieldnames.index("Account Name")
+        username_col = fieldnames.index("GitHub Username")
         for row in reader:
-            acct = row["Account Name"]
+            if not row:
+                # Skip blank lines.
+                continue
+            acct = row[acct_col]
             if acct == "Opfocus Test":
                 # A bogus entry made by the vendor. skip it.
                 continue
-            username = row["GitHub Username"]
+            username = row[username_col]
             assert github_username(username), f"GitHub Username is not valid: {username}"
 
 
@@ -122,10 +134,11 @@ def assert_sorted(strs, what):
         what (str): a description of what these are, for the failure message.
     """
     strs = list(strs)
-    sstrs = sorted(strs)
-    if strs == sstrs:
+    if all(a <= b for a, b in zip(strs, strs[1:])):
         return
 
+    # Only sort and diff when we need to explain the failure.
+    sstrs = sorted(strs)
     lines = difflib.Differ().compare(strs, sstrs)
     out_of_place = set(ln[2:] for ln in lines if ln.startswith(("-", "+")))
     msg = "{} must be sorted. These are out of place: {}".format(
@@ -1,6 +1,7 @@
 import pytest
 
 from repo_tools_data_schema.repo_tools_data_schema import (
+    github_username,
     valid_email,
 )
 
@@ -9,6 +10,27 @@ from repo_tools_data_schema.repo_tools_data_schema import (
     ("nedbat@gmail.com@bad", False),
     ("nedbat", False),
     ("nedbat@gmail.com,", False),
+    ("ned;bat@gmail.com", False),
+    ("nedbat@gmail.com?", False),
+    ("ned\\bat@gmail.com", False),
+    ("ned%bat@gmail.com", False),
+    ("ned bat@gmail.com", False),
+    (None, False),
 ])
 def test_valid_email(email, ok):
     assert valid_email(email) is ok
+
+
+@pytest.mark.parametrize("username, ok", [
+    ("nedbat", True),
+    ("ned-bat_2", True),
+    ("dependabot[bot]", True),
+    ("dependabot%5Bbot%5D", True),
+    ("anant*", True),
+    ("ned bat", False),
+    ("nedbat[bot]x", False),
+    ("[bot]", False),
+    ("", False),
+])
+def test_github_username(username, ok):
+    assert github_username(username) is ok